@@ -1,5 +1,5 @@
-from server import mcp
+from BIBLEFIGHT.__main__ import main
 
 
 if __name__ == "__main__":
-    mcp.run()
+    main()
@@ -1,8 +1,8 @@
 from __future__ import annotations
 
 import asyncio
-import sys
 import json
+import sys
 from pathlib import Path
 from typing import Any
 
@@ -22,6 +22,19 @@ if str(SRC) not in sys.path:
 
 from BIBLEFIGHT.server import mcp  # type: ignore
 
+try:  # same optional speedup as the server; stdlib json is the fallback
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _dumps(obj: Any) -> str:
+    return orjson.dumps(obj).decode() if orjson is not None else json.dumps(obj)
+
+
+def _loads(text: str) -> Any:
+    return orjson.loads(text) if orjson is not None else json.loads(text)
+
 
 async def sampling_handler(
     messages: list[SamplingMessage],
@@ -34,14 +47,21 @@ async def sampling_handler(
     - If user mentions money/wealth, return common refs
     - If claim contains "helps themselves", return common misattribution refs
     - Otherwise return a generic pair
+    - Combined support/challenge prompts get a JSON object
     """
-    text = " \n".join(getattr(m, "text", "") for m in messages if getattr(m, "text", ""))
+    texts = (getattr(getattr(m, "content", None), "text", "") for m in messages)
+    text = " \n".join(t for t in texts if t)
     lower = text.lower()
     if "money" in lower or "wealth" in lower or "rich" in lower:
-        return "1 Timothy 6:10; Matthew 6:24; Proverbs 11:28"
-    if "helps themselves" in lower:
-        return "Proverbs 28:26; Psalm 37:5; Jeremiah 17:5; Matthew 6:33"
-    return "John 3:16; Psalm 23:1-3; Matthew 5:9-12"
+        support = ["1 Timothy 6:10", "Matthew 6:24", "Proverbs 11:28"]
+    elif "helps themselves" in lower:
+        support = ["Proverbs 28:26", "Psalm 37:5", "Jeremiah 17:5", "Matthew 6:33"]
+    else:
+        support = ["John 3:16", "Psalm 23:1-3", "Matthew 5:9-12"]
+    # Combined support/challenge prompt expects a JSON object
+    if '"support"' in text:
+        return _dumps({"support": support, "challenge": ["Romans 3:23", "Micah 6:8"]})
+    return "; ".join(support)
 
 
 async def main() -> None:
@@ -109,7 +129,7 @@ async def main() -> None:
                     for c in getattr(resp, "content", []) or []:
                         text = getattr(c, "text", None)
                         if text:
-                            payload = json.loads(text)
+                            payload = _loads(text)
                             break
                 except Exception:
                     payload = None
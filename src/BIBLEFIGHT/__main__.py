@@ -3,25 +3,43 @@ from __future__ import annotations
 import logging
 import asyncio
 import argparse
-import os
-from .server import mcp
+from .server import mcp, settings
+
+try:  # optional: libuv-backed event loop (Unix only), `pip install BIBLEFIGHT-mcp[speed]`
+    import uvloop
+except ImportError:
+    uvloop = None
 
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger("BIBLEFIGHT")
 
 
+def configure_logging(level: str | int) -> None:
+    """Install the root handler once, at startup rather than at import time."""
+    # Skip per-record thread/process lookups; we never log those fields
+    logging.logThreads = False
+    logging.logProcesses = False
+    logging.logMultiprocessing = False
+    logging.basicConfig(level=level)
+    logger.setLevel(level)
+
+
 def main():
     parser = argparse.ArgumentParser(description="Run BibleFight MCP server")
     parser.add_argument("--debug", action="store_true", help="Enable DEBUG logging")
+    parser.add_argument(
+        "--log-level",
+        default=settings.LOG_LEVEL,
+        help="Logging level (e.g., INFO, DEBUG). Defaults to BIBLEFIGHT_LOG_LEVEL or INFO.",
+    )
     args = parser.parse_args()
 
-    logger.setLevel(logging.DEBUG if args.debug else logging.INFO)
+    configure_logging("DEBUG" if args.debug else str(args.log_level).upper())
 
     try:
-        asyncio.run(mcp.run_async())
+        asyncio.run(mcp.run_async(), loop_factory=uvloop.new_event_loop if uvloop else None)
     except KeyboardInterrupt:
         logger.info("🛑 Keyboard interrupt received. Shutting down...")
         exit(0)
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
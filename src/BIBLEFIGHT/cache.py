@@ -0,0 +1,103 @@
+from __future__ import annotations
+
+import logging
+import os
+import time
+from collections import OrderedDict
+from typing import Any
+
+try:  # optional: persistent cache shared across restarts/processes
+    import diskcache
+except ImportError:
+    diskcache = None
+
+logger = logging.getLogger("BIBLEFIGHT")
+
+
+class TTLCache:
+    """Small in-process LRU cache whose entries expire after `ttl` seconds."""
+
+    def __init__(self, maxsize: int = 512, ttl: float = 3600.0) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Any, tuple[float, Any]] = OrderedDict()
+
+    def get(self, key: Any) -> Any | None:
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        expires, value = entry
+        if expires < time.monotonic():
+            del self._data[key]
+            return None
+        self._data.move_to_end(key)
+        return value
+
+    def set(self, key: Any, value: Any) -> None:
+        if key in self._data:
+            self._data.move_to_end(key)
+        elif len(self._data) >= self.maxsize:
+            self._data.popitem(last=False)
+        self._data[key] = (time.monotonic() + self.ttl, value)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+
+class DiskTTLCache:
+    """TTLCache-compatible wrapper around a diskcache.Cache; entries survive restarts.
+
+    Holds at most `maxsize` entries, dropping the least recently stored first.
+    get/set are synchronous sqlite calls made on the event loop thread: they block it
+    briefly (well under a millisecond locally), which is far below the network round
+    trip a hit saves, but keep CACHE_DIR on local disk rather than a network share.
+    """
+
+    def __init__(self, store: Any, namespace: str, maxsize: int, ttl: float) -> None:
+        self._store = store
+        self.namespace = namespace
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+    def get(self, key: Any) -> Any | None:
+        return self._store.get(key)
+
+    def set(self, key: Any, value: Any) -> None:
+        # diskcache updates existing keys in place, keeping their insertion order;
+        # delete first so a re-stored key becomes the newest
+        self._store.delete(key)
+        self._store.set(key, value, expire=self.ttl)
+        while len(self._store) > self.maxsize:
+            try:
+                oldest, _ = self._store.peekitem(last=False)
+            except KeyError:  # emptied concurrently
+                break
+            self._store.delete(oldest)
+
+    def clear(self) -> None:
+        self._store.clear()
+
+    def __len__(self) -> int:
+        return len(self._store)
+
+
+_disk_stores: dict[str, Any] = {}
+
+
+def make_cache(
+    namespace: str, *, maxsize: int, ttl: float, directory: str | None = None
+) -> TTLCache | DiskTTLCache:
+    """Build an on-disk cache under `directory`/`namespace` when configured and diskcache
+    is installed, else an in-process TTLCache."""
+    if directory and diskcache is None:
+        logger.warning("Cache directory set but diskcache is not installed; caching in memory")
+    if not directory or diskcache is None:
+        return TTLCache(maxsize=maxsize, ttl=ttl)
+    path = os.path.join(os.path.expanduser(directory), namespace)
+    store = _disk_stores.get(path)
+    if store is None:
+        store = _disk_stores[path] = diskcache.Cache(path, size_limit=2**30)
+    return DiskTTLCache(store, namespace, maxsize, ttl)
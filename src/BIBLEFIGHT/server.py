@@ -1,18 +1,70 @@
 from __future__ import annotations
 
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
 from typing import Any, Literal
+from urllib.parse import quote
+import asyncio
+import functools
 import re
+import json
 import logging
+import sys
 
 import httpx
 from fastmcp import Context, FastMCP
 from pydantic import BaseModel, Field
 
-from .settings import Settings
+try:  # orjson parses verse-heavy payloads several times faster; stdlib json is the fallback
+    import orjson
+except ImportError:
+    orjson = None
 
+from .cache import make_cache
+from .settings import Settings, get_settings
 
-settings = Settings()
+
+settings = get_settings()
 logger = logging.getLogger("BIBLEFIGHT")
+
+# Shared HTTP client: keeps TLS connections to bible-api.com / API.Bible alive across tool calls
+_http_client: httpx.AsyncClient | None = None
+_http_client_users = 0
+
+
+def _get_client() -> httpx.AsyncClient:
+    """Return the shared pooled client, creating it on first use (or after it was closed)."""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        # Pool/HTTP2 settings live on the transport when one is supplied; retries cover
+        # connection-level failures (refused/reset) without a Python-level retry loop
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(max_connections=50, max_keepalive_connections=20, keepalive_expiry=60),
+            retries=2,
+        )
+        _http_client = httpx.AsyncClient(
+            transport=transport,
+            timeout=httpx.Timeout(20.0, connect=5.0),
+        )
+    return _http_client
+
+
+@asynccontextmanager
+async def _lifespan(server: FastMCP) -> AsyncIterator[dict[str, Any]]:
+    """Open the shared client at startup; close it once the last session shuts down."""
+    global _http_client, _http_client_users
+    _get_client()
+    _http_client_users += 1
+    try:
+        yield {}
+    finally:
+        _http_client_users -= 1
+        if _http_client_users == 0 and _http_client is not None:
+            await _http_client.aclose()
+            _http_client = None
+
+
 mcp = FastMCP(
     name="BIBLEFIGHT",
     instructions=(
@@ -20,80 +72,151 @@ mcp = FastMCP(
         and give challenging or contradicting verses. Or, look up a passage by translation,
         book, chapter, and/or verse."""
     ),
+    lifespan=_lifespan,
 )
 
 
-# Mapping of API.Bible/USFM book codes to human-readable names for bible-api.com
-USFM_TO_BOOK: dict[str, str] = {
-    # Old Testament
-    "GEN": "Genesis",
-    "EXO": "Exodus",
-    "LEV": "Leviticus",
-    "NUM": "Numbers",
-    "DEU": "Deuteronomy",
-    "JOS": "Joshua",
-    "JDG": "Judges",
-    "RUT": "Ruth",
-    "1SA": "1 Samuel",
-    "2SA": "2 Samuel",
-    "1KI": "1 Kings",
-    "2KI": "2 Kings",
-    "1CH": "1 Chronicles",
-    "2CH": "2 Chronicles",
-    "EZR": "Ezra",
-    "NEH": "Nehemiah",
-    "EST": "Esther",
-    "JOB": "Job",
-    "PSA": "Psalms",
-    "PRO": "Proverbs",
-    "ECC": "Ecclesiastes",
-    "SNG": "Song of Solomon",
-    "ISA": "Isaiah",
-    "JER": "Jeremiah",
-    "LAM": "Lamentations",
-    "EZK": "Ezekiel",
-    "DAN": "Daniel",
-    "HOS": "Hosea",
-    "JOL": "Joel",
-    "AMO": "Amos",
-    "OBA": "Obadiah",
-    "JON": "Jonah",
-    "MIC": "Micah",
-    "NAM": "Nahum",
-    "HAB": "Habakkuk",
-    "ZEP": "Zephaniah",
-    "HAG": "Haggai",
-    "ZEC": "Zechariah",
-    "MAL": "Malachi",
-    # New Testament
-    "MAT": "Matthew",
-    "MRK": "Mark",
-    "LUK": "Luke",
-    "JHN": "John",
-    "ACT": "Acts",
-    "ROM": "Romans",
-    "1CO": "1 Corinthians",
-    "2CO": "2 Corinthians",
-    "GAL": "Galatians",
-    "EPH": "Ephesians",
-    "PHP": "Philippians",
-    "COL": "Colossians",
-    "1TH": "1 Thessalonians",
-    "2TH": "2 Thessalonians",
-    "1TI": "1 Timothy",
-    "2TI": "2 Timothy",
-    "TIT": "Titus",
-    "PHM": "Philemon",
-    "HEB": "Hebrews",
-    "JAS": "James",
-    "1PE": "1 Peter",
-    "2PE": "2 Peter",
-    "1JN": "1 John",
-    "2JN": "2 John",
-    "3JN": "3 John",
-    "JUD": "Jude",
-    "REV": "Revelation",
-}
+# Scripture text is immutable, so passages keep for a day; search rankings can drift
+# (in memory, or on disk under BIBLEFIGHT_CACHE_DIR when diskcache is installed)
+_passage_cache = make_cache("passage", maxsize=512, ttl=24 * 3600, directory=settings.CACHE_DIR)
+_search_cache = make_cache("search", maxsize=512, ttl=30 * 60, directory=settings.CACHE_DIR)
+# LLM-proposed refs, keyed on (kind, canonical claim); kind is "support" or "challenge"
+_llm_ref_cache = make_cache("llm_refs", maxsize=512, ttl=3600, directory=settings.CACHE_DIR)
+
+# Process-wide cap on in-flight bible-api.com requests (shared by all tool calls) to stay
+# clear of its rate limiting
+_bible_api_sem: asyncio.Semaphore | None = None
+_bible_api_sem_loop: asyncio.AbstractEventLoop | None = None
+
+
+def _bible_api_semaphore() -> asyncio.Semaphore:
+    """Return the shared semaphore, rebuilt if the running event loop changed."""
+    global _bible_api_sem, _bible_api_sem_loop
+    loop = asyncio.get_running_loop()
+    if _bible_api_sem is None or _bible_api_sem_loop is not loop:
+        _bible_api_sem = asyncio.Semaphore(max(1, int(settings.BIBLE_API_MAX_CONCURRENCY)))
+        _bible_api_sem_loop = loop
+    return _bible_api_sem
+
+def _json_loads(b: bytes | str) -> Any:
+    """Decode a JSON body with orjson when available, else stdlib json."""
+    return orjson.loads(b) if orjson is not None else json.loads(b)
+
+
+_BIBLE_API_BASE = "https://bible-api.com/"
+
+# Leading ordinal followed by a space, e.g. "1 Timothy 6:10"
+_ORD_BOOK_RE = re.compile(r"^(\d)\s+(.*)$")
+# Whitespace runs, collapsed to one space in snippets
+_WS_RE = re.compile(r"\s+")
+# Whitespace make_snippet would change: edge whitespace, runs, or anything but a plain space
+_WS_DIRTY_RE = re.compile(r"^\s|\s$|\s{2,}|[^\S ]")
+# Separators between references in LLM responses
+_REF_SPLIT_RE = re.compile(r"[;\n]+")
+
+
+def _split_refs(text: str) -> list[str]:
+    """Split a semicolon/newline-separated LLM reply into stripped, non-empty refs."""
+    return [p for p in map(str.strip, _REF_SPLIT_RE.split(text)) if p]
+
+
+# Mapping of API.Bible/USFM book codes to human-readable names for bible-api.com.
+# Built on first use: only the API.Bible search path (BIBLE_API_KEY set) needs it.
+@functools.cache
+def _usfm_to_book() -> dict[str, str]:
+    table = {
+        # Old Testament
+        "GEN": "Genesis",
+        "EXO": "Exodus",
+        "LEV": "Leviticus",
+        "NUM": "Numbers",
+        "DEU": "Deuteronomy",
+        "JOS": "Joshua",
+        "JDG": "Judges",
+        "RUT": "Ruth",
+        "1SA": "1 Samuel",
+        "2SA": "2 Samuel",
+        "1KI": "1 Kings",
+        "2KI": "2 Kings",
+        "1CH": "1 Chronicles",
+        "2CH": "2 Chronicles",
+        "EZR": "Ezra",
+        "NEH": "Nehemiah",
+        "EST": "Esther",
+        "JOB": "Job",
+        "PSA": "Psalms",
+        "PRO": "Proverbs",
+        "ECC": "Ecclesiastes",
+        "SNG": "Song of Solomon",
+        "ISA": "Isaiah",
+        "JER": "Jeremiah",
+        "LAM": "Lamentations",
+        "EZK": "Ezekiel",
+        "DAN": "Daniel",
+        "HOS": "Hosea",
+        "JOL": "Joel",
+        "AMO": "Amos",
+        "OBA": "Obadiah",
+        "JON": "Jonah",
+        "MIC": "Micah",
+        "NAM": "Nahum",
+        "HAB": "Habakkuk",
+        "ZEP": "Zephaniah",
+        "HAG": "Haggai",
+        "ZEC": "Zechariah",
+        "MAL": "Malachi",
+        # New Testament
+        "MAT": "Matthew",
+        "MRK": "Mark",
+        "LUK": "Luke",
+        "JHN": "John",
+        "ACT": "Acts",
+        "ROM": "Romans",
+        "1CO": "1 Corinthians",
+        "2CO": "2 Corinthians",
+        "GAL": "Galatians",
+        "EPH": "Ephesians",
+        "PHP": "Philippians",
+        "COL": "Colossians",
+        "1TH": "1 Thessalonians",
+        "2TH": "2 Thessalonians",
+        "1TI": "1 Timothy",
+        "2TI": "2 Timothy",
+        "TIT": "Titus",
+        "PHM": "Philemon",
+        "HEB": "Hebrews",
+        "JAS": "James",
+        "1PE": "1 Peter",
+        "2PE": "2 Peter",
+        "1JN": "1 John",
+        "2JN": "2 John",
+        "3JN": "3 John",
+        "JUD": "Jude",
+        "REV": "Revelation",
+    }
+    return {sys.intern(k): sys.intern(v) for k, v in table.items()}
+
+
+def __getattr__(name: str) -> Any:
+    # PEP 562: keep `server.USFM_TO_BOOK` importable without building it at import time
+    if name == "USFM_TO_BOOK":
+        return _usfm_to_book()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_usfm_seg(p: str) -> tuple[str, int, int] | None:
+    """Parse one 'JHN.3.16' segment into (book, chapter, verse); memoized across a response."""
+    segs = p.split(".")
+    if len(segs) != 3:
+        return None
+    book = _usfm_to_book().get(segs[0].strip().upper())
+    if not book:
+        return None
+    try:
+        return (book, int(segs[1]), int(segs[2]))
+    except ValueError:
+        return None
 
 
 def _normalize_api_bible_id(id_str: str) -> str | None:
@@ -108,23 +231,13 @@ def _normalize_api_bible_id(id_str: str) -> str | None:
     # Examples: JHN.3.16 or JHN.3.16-JHN.3.18
     try:
         parts = id_str.split("-")
-        def parse(p: str) -> tuple[str, int, int] | None:
-            segs = p.split(".")
-            if len(segs) != 3:
-                return None
-            book_code, ch_str, vs_str = segs[0].strip().upper(), segs[1], segs[2]
-            book = USFM_TO_BOOK.get(book_code)
-            if not book:
-                return None
-            return (book, int(ch_str), int(vs_str))
-
-        left = parse(parts[0])
+        left = _parse_usfm_seg(parts[0])
         if not left:
             return None
         if len(parts) == 1:
             book, ch, vs = left
             return f"{book} {ch}:{vs}"
-        right = parse(parts[1])
+        right = _parse_usfm_seg(parts[1])
         if not right:
             return None
         l_book, l_ch, l_vs = left
@@ -136,7 +249,7 @@ def _normalize_api_bible_id(id_str: str) -> str | None:
     except Exception:
         return None
 
-class AnalyzeClaimArgs(BaseModel):
+class AnalyzeClaimArgs(BaseModel, frozen=True, extra="forbid"):
     claim: str = Field(
         ..., description="The phrase/claim to evaluate, e.g., 'Money is the root of all evil'",
         examples=["God helps those who help themselves", "Blessed are the peacemakers"],
@@ -197,6 +310,10 @@ class AnalyzeClaimArgs(BaseModel):
         description="Offset for API.Bible search pagination.",
         examples=[0, 10, 20],
     )
+    include_raw: bool = Field(
+        default=False,
+        description="Attach the full bible-api.com response as 'raw' on each passage.",
+    )
 
 
 @mcp.tool
@@ -221,6 +338,7 @@ async def analyze_claim(args: AnalyzeClaimArgs, ctx: Context) -> dict[str, Any]:
     - search_fuzziness (AUTO|0|1|2, optional): Fuzziness for API.Bible search.
     - search_limit (int, optional): Max search results (default 10).
     - search_offset (int, optional): Pagination offset.
+    - include_raw (bool, optional): Attach the raw bible-api.com response to each passage.
 
     Returns:
     - Object with: claim, translation, context_verses, candidates[], challengers[]
@@ -251,96 +369,162 @@ async def analyze_claim(args: AnalyzeClaimArgs, ctx: Context) -> dict[str, Any]:
         settings.DEFAULT_INCLUDE_CHALLENGERS if args.include_challengers is None else bool(args.include_challengers)
     )
 
+    max_results = max(1, int(settings.DEFAULT_MAX_RESULTS))
+    # Resolve the API.Bible knobs once here; the pipelines below only see plain locals
+    search_opts: dict[str, Any] = {
+        "sort": args.search_sort,
+        "search_range": args.search_range,
+        "fuzziness": args.search_fuzziness,
+        "limit": args.search_limit,
+        "offset": args.search_offset,
+    }
+
     logger.info("Analyze claim: '%s' | translation=%s context=%d snippets=%s", claim, translation, context_n, snippet_limit)
-    # Step 1: candidate references
-    candidate_refs: list[str] = []
-    if settings.BIBLE_API_KEY:
-        try:
-            logger.debug("Searching API.Bible for candidates…")
-            candidate_refs = await search_candidates_api_bible(
-                query=claim,
-                cfg=settings,
-                sort=args.search_sort,
-                search_range=args.search_range,
-                fuzziness=args.search_fuzziness,
-                limit=args.search_limit,
-                offset=args.search_offset,
-            )
-        except Exception as e:  # Fallback to LLM extraction, then heuristic
-            await ctx.warning(f"API.Bible search failed; falling back. {e}")
-            logger.exception("API.Bible search failed")
-            candidate_refs = await extract_references_via_llm(claim, ctx)
+    client = _get_client()
+    fetch_opts = dict(
+        client=client,
+        translation=translation,
+        context_n=context_n,
+        snippet_limit=snippet_limit,
+        include_snippets=include_snippets,
+        include_raw=args.include_raw,
+        ctx=ctx,
+    )
+
+    # Without an API key both ref lists come from the LLM: ask for them in one sampling call.
+    # Both pipelines await the same task; each falls back to its dedicated prompt if empty.
+    dual_task: asyncio.Task[tuple[list[str], list[str]]] | None = None
+    if not settings.BIBLE_API_KEY and include_supporting and include_challengers:
+        dual_task = asyncio.create_task(_extract_refs_dual(claim, ctx))
+
+    # Pipeline A: candidate references -> supporting passages
+    async def _supporting_pipeline() -> list[PassageOut]:
+        if not include_supporting:
+            return []
+        candidate_refs: list[str] = []
+        if settings.BIBLE_API_KEY:
+            try:
+                logger.debug("Searching API.Bible for candidates…")
+                candidate_refs = await search_candidates_api_bible(
+                    query=claim,
+                    cfg=settings,
+                    **search_opts,
+                )
+            except Exception as e:  # Fallback to LLM extraction, then heuristic
+                await ctx.warning(f"API.Bible search failed; falling back. {e}")
+                logger.exception("API.Bible search failed")
+                candidate_refs = await extract_references_via_llm(claim, ctx)
+                if not candidate_refs:
+                    candidate_refs = _fallback_candidate_refs(claim, max_results)
+        else:
+            logger.debug("No API key; extracting references via LLM sampling")
+            if dual_task is not None:
+                candidate_refs = (await dual_task)[0]
             if not candidate_refs:
-                candidate_refs = _fallback_candidate_refs(claim, settings.DEFAULT_MAX_RESULTS)
-    else:
-        logger.debug("No API key; extracting references via LLM sampling")
-        candidate_refs = await extract_references_via_llm(claim, ctx)
-        if not candidate_refs:
-            candidate_refs = _fallback_candidate_refs(claim, settings.DEFAULT_MAX_RESULTS)
-
-    # Deduplicate and cap
-    seen = set()
-    unique_refs = []
-    for r in candidate_refs:
-        key = r.strip().upper()
-        if key and key not in seen:
-            seen.add(key)
-            unique_refs.append(r)
-    candidate_refs = unique_refs[: max(1, int(settings.DEFAULT_MAX_RESULTS))]
-    logger.info("Candidate refs: %s", candidate_refs)
-
-    # Step 2: fetch supporting passages + context from bible-api.com
-    passages: list[dict[str, Any]] = []
-    if include_supporting:
+                candidate_refs = await extract_references_via_llm(claim, ctx)
+            if not candidate_refs:
+                candidate_refs = _fallback_candidate_refs(claim, max_results)
+
+        candidate_refs = _dedupe_refs(candidate_refs, max_results)
+        logger.info("Candidate refs: %s", candidate_refs)
         logger.info("Fetching supporting passages (%d)…", len(candidate_refs))
-        async with httpx.AsyncClient(timeout=20) as client:
-            for ref in candidate_refs:
-                try:
-                    passage = await fetch_passage_with_context(client, ref, translation, context_n)
-                    if passage:
-                        if include_snippets and snippet_limit is not None:
-                            passage["snippet"] = make_snippet(passage.get("text", ""), snippet_limit)
-                            passage["snippet_chars"] = snippet_limit
-                        passages.append(passage)
-                except Exception as e:
-                    await ctx.warning(f"Failed fetching '{ref}': {e}")
-                    logger.exception("Fetch failed for supporting '%s'", ref)
-
-    # Step 3: propose challenging/contradicting verses via LLM
-    challengers: list[str] = []
-    if include_challengers:
+        return await _fetch_many(refs=candidate_refs, **fetch_opts)
+
+    # Pipeline B: LLM-proposed challenging/contradicting refs -> their passages
+    async def _challenger_pipeline() -> list[PassageOut]:
+        if not include_challengers:
+            return []
         logger.info("Proposing challenging refs via LLM…")
-        challengers = await propose_challengers(claim, ctx)
+        challengers = (await dual_task)[1] if dual_task is not None else []
         if not challengers:
-            challengers = _fallback_challenger_refs(claim, settings.DEFAULT_MAX_RESULTS)
-
-    # Step 4: fetch challengers' passages
-    challenging_passages: list[dict[str, Any]] = []
-    if include_challengers and challengers:
+            challengers = await propose_challengers(claim, ctx)
+        if not challengers:
+            challengers = _fallback_challenger_refs(claim, max_results)
         logger.info("Fetching challenging passages (%d)…", len(challengers))
-        async with httpx.AsyncClient(timeout=20) as client:
-            for ref in challengers:
-                try:
-                    passage = await fetch_passage_with_context(client, ref, translation, context_n)
-                    if passage:
-                        if include_snippets and snippet_limit is not None:
-                            passage["snippet"] = make_snippet(passage.get("text", ""), snippet_limit)
-                            passage["snippet_chars"] = snippet_limit
-                        challenging_passages.append(passage)
-                except Exception:
-                    # Ignore failures silently for challengers
-                    logger.debug("Fetch failed for challenger '%s'", ref)
-                    pass
+        return await _fetch_many(refs=challengers, silent_errors=True, **fetch_opts)
+
+    # Neither pipeline depends on the other, so overlap LLM sampling with HTTP fetches.
+    # Both start now; if one fails (or the call is cancelled) don't leave the other running.
+    tasks = [
+        asyncio.create_task(_supporting_pipeline()),
+        asyncio.create_task(_challenger_pipeline()),
+    ]
+    try:
+        passages, challenging_passages = await asyncio.gather(*tasks)
+    finally:
+        for task in (*tasks, dual_task):
+            if task is not None:
+                task.cancel()
 
     return {
         "claim": claim,
         "translation": translation,
         "context_verses": context_n,
-        "candidates": passages,
-        "challengers": challenging_passages,
+        "candidates": [p.model_dump(exclude_none=True) for p in passages],
+        "challengers": [p.model_dump(exclude_none=True) for p in challenging_passages],
     }
 
 
+def _dedupe_refs(refs: list[str], limit: int) -> list[str]:
+    """Case/whitespace-insensitive dedupe keeping first-seen order and spelling, capped at `limit`."""
+    stripped = [r for r in (r.strip() for r in refs) if r]
+    first: dict[str, str] = {}
+    for r in stripped:
+        first.setdefault(r.upper(), r)
+    return list(first.values())[:limit]
+
+
+async def _fetch_many(
+    client: httpx.AsyncClient,
+    refs: list[str],
+    translation: str,
+    context_n: int,
+    snippet_limit: int | None,
+    include_snippets: bool,
+    ctx: Context,
+    include_raw: bool = False,
+    silent_errors: bool = False,
+) -> list[PassageOut]:
+    """Fetch many refs concurrently, dropping misses and attaching snippets.
+
+    Failures are reported via ctx.warning unless `silent_errors` is set.
+    """
+    if not refs:
+        return []
+    batched: dict[str, PassageOut] = {}
+    if settings.BATCH_FETCH and len(refs) > 1:
+        try:
+            batched = await fetch_passages_batch(client, refs, translation, context_n, include_raw=include_raw)
+        except Exception as e:
+            logger.warning("Batched fetch failed; fetching refs individually: %s", e)
+    remaining = [r for r in refs if r not in batched]
+    # Concurrency toward bible-api.com is bounded inside fetch_passage_with_context
+    results = await asyncio.gather(
+        *[fetch_passage_with_context(client, r, translation, context_n, include_raw=include_raw) for r in remaining],
+        return_exceptions=True,
+    )
+    by_ref: dict[str, PassageOut | BaseException | None] = {**batched, **dict(zip(remaining, results))}
+    passages: list[PassageOut] = []
+    for ref in refs:
+        passage = by_ref[ref]
+        # BaseException: a cancelled child comes back as CancelledError, not Exception
+        if isinstance(passage, BaseException):
+            if silent_errors:
+                logger.debug("Fetch failed for '%s'", ref)
+            else:
+                await ctx.warning(f"Failed fetching '{ref}': {passage}")
+                # Expected network/HTTP failure: skip traceback formatting
+                logger.warning("Fetch failed for %r: %s", ref, passage)
+        elif passage:
+            passages.append(passage)
+    if not (include_snippets and snippet_limit is not None):
+        return passages
+    return [
+        p.model_copy(update={"snippet": make_snippet(p.text, snippet_limit), "snippet_chars": snippet_limit})
+        for p in passages
+    ]
+
+
 async def search_candidates_api_bible(
     query: str,
     cfg: Settings,
@@ -357,6 +541,10 @@ async def search_candidates_api_bible(
     GET /v1/bibles/{bibleId}/search?query=...
     (Requires header: api-key)
     """
+    cache_key = (query, cfg.BIBLE_API_BIBLE_ID, sort, search_range, fuzziness, limit, offset)
+    cached = _search_cache.get(cache_key)
+    if cached is not None:
+        return list(cached)
     base = "https://api.scripture.api.bible/v1"
     url = f"{base}/bibles/{cfg.BIBLE_API_BIBLE_ID}/search"
     params: dict[str, Any] = {"query": query, "limit": int(limit or 10)}
@@ -369,32 +557,100 @@ async def search_candidates_api_bible(
     if fuzziness:
         params["fuzziness"] = fuzziness
     headers = {"api-key": cfg.BIBLE_API_KEY}
-    async with httpx.AsyncClient(timeout=15) as client:
-        resp = await client.get(url, params=params, headers=headers)
-        resp.raise_for_status()
-        data = resp.json().get("data", {})
-        # Prefer verses list; fallback to passages
-        refs: list[str] = []
-        for v in data.get("verses", []) or []:
-            # Prefer human reference; normalize verseId if needed
-            ref = v.get("reference")
-            if not ref:
-                ref = _normalize_api_bible_id(v.get("verseId") or "")
-            if ref:
-                refs.append(str(ref))
-        for p in data.get("passages", []) or []:
-            ref = p.get("reference")
-            if not ref:
-                ref = _normalize_api_bible_id(p.get("id") or "")
-            if ref:
-                refs.append(str(ref))
-        return refs
+    resp = await _get_client().get(url, params=params, headers=headers, timeout=15)
+    resp.raise_for_status()
+    data = _json_loads(resp.content).get("data", {})
+    # Prefer verses list; fallback to passages
+    refs: list[str] = []
+    for v in data.get("verses", []) or []:
+        # Prefer human reference; normalize verseId if needed
+        ref = v.get("reference")
+        if not ref:
+            ref = _normalize_api_bible_id(v.get("verseId") or "")
+        if ref:
+            refs.append(str(ref))
+    for p in data.get("passages", []) or []:
+        ref = p.get("reference")
+        if not ref:
+            ref = _normalize_api_bible_id(p.get("id") or "")
+        if ref:
+            refs.append(str(ref))
+    _search_cache.set(cache_key, refs)
+    return list(refs)
+
+
+_CLAIM_WORD_RE = re.compile(r"[\w']+")
+_CLAIM_STOPWORDS = frozenset({"a", "an", "the"})
+
+
+def _canonical_claim(claim: str) -> str:
+    """Case-, punctuation- and article-insensitive form of a claim, used as a cache key.
+
+    Claims with no word characters at all fall back to their whitespace-normalized
+    form so unrelated claims never share the empty key.
+    """
+    folded = claim.casefold()
+    words = [w for w in _CLAIM_WORD_RE.findall(folded) if w not in _CLAIM_STOPWORDS]
+    return " ".join(words) or _WS_RE.sub(" ", folded).strip()
+
+
+def _json_refs(value: Any) -> list[str]:
+    """Refs from one field of the combined JSON reply.
+
+    A list keeps only its string items; a string is split like a plain-text reply;
+    any other shape yields [] so the caller falls back to the single-purpose prompt.
+    """
+    if isinstance(value, str):
+        return _split_refs(value)
+    if not isinstance(value, list):
+        return []
+    return [r for r in (v.strip() for v in value if isinstance(v, str)) if r]
+
+
+async def _extract_refs_dual(claim: str, ctx: Context) -> tuple[list[str], list[str]]:
+    """Ask the client LLM for supporting and challenging references in a single sampling call.
+
+    Returns ([], []) if sampling fails or the reply is not the expected JSON object.
+    """
+    canon = _canonical_claim(claim)
+    cached_support = _llm_ref_cache.get(("support", canon))
+    cached_challenge = _llm_ref_cache.get(("challenge", canon))
+    if cached_support is not None and cached_challenge is not None:
+        return list(cached_support), list(cached_challenge)
+    prompt = (
+        "For the following claim or phrase, return a JSON object "
+        '{"support": [...], "challenge": [...]} where "support" holds 3-5 likely Bible '
+        "references (book chapter:verse or ranges) the claim corresponds to, and "
+        '"challenge" holds 3-5 references that challenge, qualify, or appear to '
+        "contradict it.\n\nClaim: "
+        f"{claim}"
+    )
+    try:
+        response = await ctx.sample(prompt, system_prompt=(
+            "You are a precise Bible cross-referencer. Return only JSON, no commentary."
+        ))
+        text = response.text or ""
+        # Tolerate code fences or stray prose around the object
+        data = _json_loads(text[text.index("{") : text.rindex("}") + 1])
+        support = _json_refs(data.get("support"))
+        challenge = _json_refs(data.get("challenge"))
+        if support:
+            _llm_ref_cache.set(("support", canon), support)
+        if challenge:
+            _llm_ref_cache.set(("challenge", canon), challenge)
+        return list(support), list(challenge)
+    except Exception:
+        return [], []
 
 
 async def extract_references_via_llm(claim: str, ctx: Context) -> list[str]:
     """Ask the client LLM to extract likely Bible references for the claim.
     Expected output: a comma-separated list like "John 3:16; Matthew 5:9-12".
     """
+    cache_key = ("support", _canonical_claim(claim))
+    cached = _llm_ref_cache.get(cache_key)
+    if cached is not None:
+        return list(cached)
     prompt = (
         "Extract 3-5 likely Bible references (book chapter:verse or ranges) that "
         "correspond to the following claim or phrase. Return only the references, "
@@ -406,15 +662,20 @@ async def extract_references_via_llm(claim: str, ctx: Context) -> list[str]:
             "You are a precise Bible reference extractor. Return only references, "
             "semicolon-separated; no commentary."
         ))
-        text = (response.text or "").strip()
-        parts = [p.strip() for p in text.replace("\n", " ").split(";")]
-        return [p for p in parts if p]
+        refs = _split_refs(response.text or "")
     except Exception:
         return []
+    if refs:
+        _llm_ref_cache.set(cache_key, refs)
+    return list(refs)
 
 
 async def propose_challengers(claim: str, ctx: Context) -> list[str]:
     """Ask the client LLM to propose verses that challenge or nuance the claim."""
+    cache_key = ("challenge", _canonical_claim(claim))
+    cached = _llm_ref_cache.get(cache_key)
+    if cached is not None:
+        return list(cached)
     prompt = (
         "Given this claim, produce 3-5 Bible references that challenge, qualify, "
         "or appear to contradict it. Return only references, semicolon-separated.\n\n"
@@ -425,63 +686,69 @@ async def propose_challengers(claim: str, ctx: Context) -> list[str]:
             "You are a critical Bible cross-referencer. Return only references, "
             "semicolon-separated; no commentary."
         ))
-        text = (response.text or "").strip()
-        parts = [p.strip() for p in text.replace("\n", " ").split(";")]
-        return [p for p in parts if p]
+        refs = _split_refs(response.text or "")
     except Exception:
         return []
+    if refs:
+        _llm_ref_cache.set(cache_key, refs)
+    return list(refs)
+
+
+# Deterministic fallback tables: claim keyword -> topic -> references
+_KEYWORD_CATEGORIES: dict[str, str] = {
+    "money": "wealth",
+    "wealth": "wealth",
+    "wealthy": "wealth",
+    "rich": "wealth",
+    "riches": "wealth",
+}
+_CATEGORY_REFS_CANDIDATE: dict[str | None, list[str]] = {
+    "wealth": ["1 Timothy 6:10", "Matthew 6:24", "Proverbs 11:28"],
+    "selfhelp": ["Proverbs 28:26", "Psalm 37:5", "Jeremiah 17:5", "Matthew 6:33"],
+    None: ["John 3:16", "Psalm 23:1-3", "Matthew 5:9-12"],
+}
+_CATEGORY_REFS_CHALLENGER: dict[str | None, list[str]] = {
+    "wealth": ["Matthew 5:9-12", "Luke 12:15", "James 5:1-6"],
+    "selfhelp": ["Ephesians 2:8-9", "Psalm 121:1-2", "Proverbs 3:5-6"],
+    None: ["Romans 3:23", "Ephesians 2:8-9", "Micah 6:8"],
+}
+_WORD_RE = re.compile(r"[a-z]+")  # apostrophes split, so "money's" still yields "money"
+
+
+def _claim_category(claim: str) -> str | None:
+    """Classify a claim into a fallback topic with one tokenize + set lookup."""
+    text = claim.lower()
+    tokens = set(_WORD_RE.findall(text))
+    cat = next((_KEYWORD_CATEGORIES[t] for t in tokens if t in _KEYWORD_CATEGORIES), None)
+    if cat is None and "helps themselves" in text:
+        cat = "selfhelp"
+    return cat
 
 
 def _fallback_candidate_refs(claim: str, max_results: int) -> list[str]:
     """Deterministic, non-LLM heuristics for extracting likely references.
     Ensures we return something even when API search and sampling are unavailable.
     """
-    text = claim.lower()
-    refs: list[str] = []
-    if any(w in text for w in ("money", "wealth", "rich")):
-        refs = [
-            "1 Timothy 6:10",
-            "Matthew 6:24",
-            "Proverbs 11:28",
-        ]
-    elif "helps themselves" in text:
-        refs = [
-            "Proverbs 28:26",
-            "Psalm 37:5",
-            "Jeremiah 17:5",
-            "Matthew 6:33",
-        ]
-    else:
-        refs = [
-            "John 3:16",
-            "Psalm 23:1-3",
-            "Matthew 5:9-12",
-        ]
-    return refs[: max(1, int(max_results))]
+    return _CATEGORY_REFS_CANDIDATE[_claim_category(claim)][: max(1, int(max_results))]
 
 
 def _fallback_challenger_refs(claim: str, max_results: int) -> list[str]:
-    text = claim.lower()
-    refs: list[str] = []
-    if any(w in text for w in ("money", "wealth", "rich")):
-        refs = [
-            "Matthew 5:9-12",
-            "Luke 12:15",
-            "James 5:1-6",
-        ]
-    elif "helps themselves" in text:
-        refs = [
-            "Ephesians 2:8-9",
-            "Psalm 121:1-2",
-            "Proverbs 3:5-6",
-        ]
-    else:
-        refs = [
-            "Romans 3:23",
-            "Ephesians 2:8-9",
-            "Micah 6:8",
-        ]
-    return refs[: max(1, int(max_results))]
+    return _CATEGORY_REFS_CHALLENGER[_claim_category(claim)][: max(1, int(max_results))]
+
+
+def _passage_key(reference: str, translation: str, context_n: int, include_raw: bool) -> str:
+    return f"{reference.lower()}|{translation}|{context_n}|{int(include_raw)}"
+
+
+class PassageOut(BaseModel, frozen=True):
+    """A fetched passage; frozen so cached instances can be shared between calls."""
+
+    reference: str
+    text: str
+    translation: str
+    raw: dict[str, Any] | None = None
+    snippet: str | None = None
+    snippet_chars: int | None = None
 
 
 async def fetch_passage_with_context(
@@ -489,51 +756,184 @@ async def fetch_passage_with_context(
     reference: str,
     translation: str,
     context_n: int,
-) -> dict[str, Any] | None:
+    include_raw: bool = False,
+) -> PassageOut | None:
     """Use bible-api.com to fetch passage and context.
 
     Examples per docs: https://bible-api.com/BOOK+CHAP:VERSE?translation=kjv
     We emulate ±N verses by expanding a small range where possible.
+    The full response is kept as `raw` only when `include_raw` is set; it is
+    usually several times larger than the passage text.
     """
+    cache_key = _passage_key(reference, translation, context_n, include_raw)
+    cached = _passage_cache.get(cache_key)
+    if cached is not None:
+        return cached
     # Try to separate book and range; if parsing fails, defer to API's user input parser
-    ref_encoded = reference.replace(" ", "+")
-    url = f"https://bible-api.com/{ref_encoded}?translation={translation}"
+    # Percent-encode the path ourselves so '?', '#' or '/' in a ref cannot leak out of it;
+    # httpx builds the query string from params
+    url = f"{_BIBLE_API_BASE}{quote(reference, safe=':-,')}"
+    params = {"translation": translation}
     # Note: bible-api.com accepts ranges and multiple refs; we rely on server to include nearby verses
-    r = await client.get(url)
-    if r.status_code != 200:
-        # Fallback: remove space after leading ordinal (e.g., "1 Timothy" -> "1Timothy")
-        m = re.match(r"^(\d)\s+(.*)$", reference)
-        if m:
-            alt = f"{m.group(1)}{m.group(2)}"
-            alt_encoded = alt.replace(" ", "+")
-            alt_url = f"https://bible-api.com/{alt_encoded}?translation={translation}"
-            r = await client.get(alt_url)
-            if r.status_code != 200:
+    async with _bible_api_semaphore():
+        r = await client.get(url, params=params)
+        if r.status_code != 200:
+            # Fallback: remove space after leading ordinal (e.g., "1 Timothy" -> "1Timothy")
+            m = _ORD_BOOK_RE.match(reference)
+            if m:
+                alt = f"{m.group(1)}{m.group(2)}"
+                alt_url = f"{_BIBLE_API_BASE}{quote(alt, safe=':-,')}"
+                r = await client.get(alt_url, params=params)
+                if r.status_code != 200:
+                    return None
+            else:
                 return None
-        else:
-            return None
-    data = r.json()
+    data = _json_loads(r.content)
     verses = data.get("verses") or []
     if not verses:
         return None
-    # construct a context window from received verses list
-    text = " ".join(v.get("text", "").strip() for v in verses)
-    return {
-        "reference": data.get("reference") or reference,
-        "text": text.strip(),
-        "translation": translation,
-        "raw": data,
-    }
+    # construct a context window from received verses list: join raw verse texts once
+    # (a list lets str.join size the result in one pass), then normalize whitespace in a
+    # single regex pass instead of stripping each verse
+    text = _WS_RE.sub(" ", " ".join([v.get("text") or "" for v in verses]))
+    # Trusted internal data: skip validation
+    passage = PassageOut.model_construct(
+        reference=data.get("reference") or reference,
+        text=text.strip(),
+        translation=translation,
+        raw=data if include_raw else None,
+    )
+    _passage_cache.set(cache_key, passage)
+    return passage
+
+
+# "Book chapter[:verse[-verse]]", e.g. "1 Timothy 6:10", "Psalm 23", "Matthew 5:9-12"
+_SIMPLE_REF_RE = re.compile(r"^(?P<book>.+?)\s+(?P<ch>\d+)(?::(?P<v1>\d+)(?:-(?P<v2>\d+))?)?$")
+
+
+def _book_key(name: str) -> str:
+    return name.lower().replace(" ", "")
+
+
+@functools.lru_cache(maxsize=256)
+def _canonical_book(name: str) -> str | None:
+    """_book_key of the one canonical book `name` abbreviates ("Ps" -> "psalms").
+
+    None when the name is unknown or ambiguous ("Phil" could be Philippians or Philemon).
+    """
+    key = _book_key(name)
+    if not key:
+        return None
+    names = [_book_key(b) for b in _usfm_to_book().values()]
+    if key in names:
+        return key
+    matches = [n for n in names if n.startswith(key)]
+    return matches[0] if len(matches) == 1 else None
+
+
+def _spans_overlap(a: tuple[str, int, int | None, int | None], b: tuple[str, int, int | None, int | None]) -> bool:
+    """Whether two (book, chapter, v1, v2) spans may share a verse; whole chapters overlap everything."""
+    if a[1] != b[1] or a[0] != b[0]:
+        return False
+    if a[2] is None or b[2] is None:
+        return True
+    return a[2] <= b[3] and b[2] <= a[3]  # type: ignore[operator]
+
+
+def _batched_reference(verses: list[dict[str, Any]], v1: int | None) -> str:
+    """Canonical "Book ch[:v1[-v2]]" label from returned verses, matching the single-ref path."""
+    first, last = verses[0], verses[-1]
+    label = f"{first.get('book_name')} {first.get('chapter')}"
+    if v1 is None:
+        return label
+    if first.get("verse") == last.get("verse"):
+        return f"{label}:{first.get('verse')}"
+    return f"{label}:{first.get('verse')}-{last.get('verse')}"
+
+
+async def fetch_passages_batch(
+    client: httpx.AsyncClient,
+    refs: list[str],
+    translation: str,
+    context_n: int,
+    include_raw: bool = False,
+) -> dict[str, PassageOut]:
+    """Fetch several simple refs with one comma-joined bible-api.com request.
+
+    Verses in the combined response are bucketed back to the ref they belong to
+    (book_name/chapter/verse). Refs whose book does not resolve to exactly one
+    canonical name, and refs that overlap an earlier ref (or repeat it) are
+    left out of the combined request, so every returned verse has exactly one owner.
+    Only refs that were cached or could be bucketed are returned; callers fetch
+    anything missing with fetch_passage_with_context.
+    """
+    found: dict[str, PassageOut] = {}
+    spans: list[tuple[str, str, int, int | None, int | None]] = []
+    for ref in refs:
+        cached = _passage_cache.get(_passage_key(ref, translation, context_n, include_raw))
+        if cached is not None:
+            found[ref] = cached
+            continue
+        m = _SIMPLE_REF_RE.match(ref.strip())
+        if not m:
+            continue
+        v1 = int(m["v1"]) if m["v1"] else None
+        v2 = int(m["v2"]) if m["v2"] else v1
+        book = _canonical_book(m["book"])
+        if book is None:
+            continue
+        span = (book, int(m["ch"]), v1, v2)
+        if any(_spans_overlap(span, other[1:]) for other in spans):
+            continue
+        spans.append((ref, *span))
+    if len(spans) < 2:
+        return found
+
+    url = _BIBLE_API_BASE + ",".join(quote(ref, safe=":-") for ref, *_ in spans)
+    async with _bible_api_semaphore():
+        r = await client.get(url, params={"translation": translation})
+    if r.status_code != 200:
+        return found
+    data = _json_loads(r.content)
+
+    buckets: dict[str, list[dict[str, Any]]] = {ref: [] for ref, *_ in spans}
+    for v in data.get("verses") or []:
+        book = _canonical_book(str(v.get("book_name") or ""))
+        for ref, ref_book, ch, v1, v2 in spans:
+            if (
+                book == ref_book
+                and v.get("chapter") == ch
+                and (v1 is None or v1 <= int(v.get("verse") or 0) <= v2)
+            ):
+                buckets[ref].append(v)
+                break
+    first_verse = {ref: v1 for ref, _, _, v1, _ in spans}
+    for ref, verses in buckets.items():
+        if not verses:
+            continue
+        reference = _batched_reference(verses, first_verse[ref])
+        text = _WS_RE.sub(" ", " ".join([v.get("text") or "" for v in verses]))
+        raw = None
+        if include_raw:
+            raw = {**{k: val for k, val in data.items() if k not in ("reference", "verses", "text")},
+                   "reference": reference, "verses": verses}
+        passage = PassageOut.model_construct(reference=reference, text=text.strip(), translation=translation, raw=raw)
+        _passage_cache.set(_passage_key(ref, translation, context_n, include_raw), passage)
+        found[ref] = passage
+    return found
 
 
 def make_snippet(text: str, limit: int) -> str:
-    s = " ".join((text or "").split())
-    if len(s) <= limit:
-        return s
-    return s[: limit - 1] + "…"
+    if not text:
+        return ""
+    # Fast path: short text whose whitespace is already single plain spaces
+    if len(text) <= limit and not _WS_DIRTY_RE.search(text):
+        return text
+    s = _WS_RE.sub(" ", text).strip()
+    return s if len(s) <= limit else s[: limit - 1] + "…"
 
 
-class GetReferenceArgs(BaseModel):
+class GetReferenceArgs(BaseModel, frozen=True, extra="forbid"):
     reference: str = Field(
         ..., description="Free-form Bible reference, e.g., 'Matthew 3:13' or 'John 3:16-18' or 'Psalm 23'.",
         examples=["Matthew 3:13", "John 3:16-18", "Psalm 23"],
@@ -549,6 +949,10 @@ class GetReferenceArgs(BaseModel):
         description="Number of verses before/after to include in context window (±N). Defaults to settings.DEFAULT_CONTEXT_VERSES.",
         examples=[7, 5],
     )
+    include_raw: bool = Field(
+        default=False,
+        description="Attach the full bible-api.com response as 'raw'.",
+    )
 
 
 @mcp.tool
@@ -562,9 +966,10 @@ async def get_reference(args: GetReferenceArgs, ctx: Context) -> dict[str, Any]:
     - reference (string, required): Human-readable reference.
     - translation (string, optional): bible-api.com translation code (e.g., 'kjv').
     - context_verses (int, optional): Verses before/after to include (±N).
+    - include_raw (bool, optional): Attach the raw bible-api.com response.
 
     Returns:
-    - Object with: reference, text, translation, raw
+    - Object with: reference, text, translation (+ raw when include_raw)
 
     Example:
     - {"reference": "Matthew 3:13", "translation": "kjv"}
@@ -574,9 +979,10 @@ async def get_reference(args: GetReferenceArgs, ctx: Context) -> dict[str, Any]:
         return {"error": "Empty reference"}
     translation = (args.translation or settings.DEFAULT_TRANSLATION).lower()
     context_n = int(args.context_verses if args.context_verses is not None else settings.DEFAULT_CONTEXT_VERSES)
-    async with httpx.AsyncClient(timeout=20) as client:
-        passage = await fetch_passage_with_context(client, ref, translation, context_n)
+    passage = await fetch_passage_with_context(
+        _get_client(), ref, translation, context_n, include_raw=args.include_raw
+    )
     if not passage:
         return {"error": f"Reference not found: {ref}"}
-    return passage
+    return passage.model_dump(exclude_none=True)
 
@@ -1,14 +1,11 @@
 from __future__ import annotations
 
+import functools
 import os
-from pydantic import BaseModel
+from dataclasses import dataclass, field
 from dotenv import load_dotenv
 
 
-# Load environment from a local .env if present
-load_dotenv()
-
-
 def _get_bool(name: str, default: bool) -> bool:
     val = os.getenv(name)
     if val is None:
@@ -16,19 +13,45 @@ def _get_bool(name: str, default: bool) -> bool:
     return val.strip().lower() in {"1", "true", "yes", "on"}
 
 
-class Settings(BaseModel):
-    # External APIs
-    BIBLE_API_KEY: str | None = os.getenv("BIBLE_API_KEY")
-    BIBLE_API_BIBLE_ID: str = os.getenv("BIBLE_API_BIBLE_ID", "06125adad2d5898a-01")
+def _env(name: str, default: str | None = None, *, repr: bool = True):
+    return field(default_factory=lambda: os.getenv(name, default), repr=repr)
 
-    # Defaults and behavior
-    DEFAULT_TRANSLATION: str = os.getenv("DEFAULT_TRANSLATION", "kjv")
-    DEFAULT_CONTEXT_VERSES: int = int(os.getenv("BIBLEFIGHT_DEFAULT_CONTEXT_VERSES", "7"))
-    DEFAULT_SNIPPET_CHARS: int = int(os.getenv("BIBLEFIGHT_DEFAULT_SNIPPET_CHARS", "180"))
-    DEFAULT_INCLUDE_SNIPPETS: bool = _get_bool("BIBLEFIGHT_INCLUDE_SNIPPETS", True)
-    DEFAULT_MAX_RESULTS: int = int(os.getenv("BIBLEFIGHT_DEFAULT_MAX_RESULTS", "5"))
-    DEFAULT_INCLUDE_SUPPORTING: bool = _get_bool("BIBLEFIGHT_INCLUDE_SUPPORTING", True)
-    DEFAULT_INCLUDE_CHALLENGERS: bool = _get_bool("BIBLEFIGHT_INCLUDE_CHALLENGERS", True)
-    LOG_LEVEL: str = os.getenv("BIBLEFIGHT_LOG_LEVEL", "INFO")
+
+def _env_int(name: str, default: int):
+    return field(default_factory=lambda: int(os.getenv(name, str(default))))
 
 
+def _env_bool(name: str, default: bool):
+    return field(default_factory=lambda: _get_bool(name, default))
+
+
+# Plain slotted dataclass: values are resolved from the environment once at construction,
+# and attribute reads are simple slot loads. Not frozen so tests can monkeypatch fields.
+@dataclass(slots=True)
+class Settings:
+    # External APIs
+    BIBLE_API_KEY: str | None = _env("BIBLE_API_KEY", repr=False)
+    BIBLE_API_BIBLE_ID: str = _env("BIBLE_API_BIBLE_ID", "06125adad2d5898a-01")
+
+    # Defaults and behavior
+    DEFAULT_TRANSLATION: str = _env("DEFAULT_TRANSLATION", "kjv")
+    DEFAULT_CONTEXT_VERSES: int = _env_int("BIBLEFIGHT_DEFAULT_CONTEXT_VERSES", 7)
+    DEFAULT_SNIPPET_CHARS: int = _env_int("BIBLEFIGHT_DEFAULT_SNIPPET_CHARS", 180)
+    DEFAULT_INCLUDE_SNIPPETS: bool = _env_bool("BIBLEFIGHT_INCLUDE_SNIPPETS", True)
+    DEFAULT_MAX_RESULTS: int = _env_int("BIBLEFIGHT_DEFAULT_MAX_RESULTS", 5)
+    DEFAULT_INCLUDE_SUPPORTING: bool = _env_bool("BIBLEFIGHT_INCLUDE_SUPPORTING", True)
+    DEFAULT_INCLUDE_CHALLENGERS: bool = _env_bool("BIBLEFIGHT_INCLUDE_CHALLENGERS", True)
+    BIBLE_API_MAX_CONCURRENCY: int = _env_int("BIBLEFIGHT_BIBLE_API_MAX_CONCURRENCY", 4)
+    BATCH_FETCH: bool = _env_bool("BIBLEFIGHT_BATCH_FETCH", False)
+    CACHE_DIR: str | None = _env("BIBLEFIGHT_CACHE_DIR")
+    LOG_LEVEL: str = _env("BIBLEFIGHT_LOG_LEVEL", "INFO")
+
+
+@functools.lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Load a local .env (if present) and resolve Settings once; later calls are cached.
+
+    Call get_settings.cache_clear() to re-read the environment.
+    """
+    load_dotenv()
+    return Settings()
@@ -23,6 +23,19 @@ from fastmcp import Client  # type: ignore
 from fastmcp.client.transports import FastMCPTransport  # type: ignore
 
 
+@pytest.fixture(autouse=True)
+def _clear_server_caches() -> Any:
+    """Start and end every test with empty caches, even when an assertion fails."""
+    import BIBLEFIGHT.server as srv  # type: ignore
+
+    caches = (srv._passage_cache, srv._search_cache, srv._llm_ref_cache)
+    for cache in caches:
+        cache.clear()
+    yield
+    for cache in caches:
+        cache.clear()
+
+
 def _parse_payload(resp: Any) -> dict[str, Any] | None:
     payload = getattr(resp, "structured_content", None)
     if isinstance(payload, dict) and payload:
@@ -42,13 +55,15 @@ def _parse_payload(resp: Any) -> dict[str, Any] | None:
 
 @pytest.mark.asyncio
 async def test_get_reference_monkeypatched(monkeypatch: pytest.MonkeyPatch) -> None:
-    async def stub_fetch(client: Any, reference: str, translation: str, context_n: int) -> dict[str, Any] | None:  # noqa: ANN401
-        return {
-            "reference": reference,
-            "text": f"Stub text for {reference} in {translation} (±{context_n})",
-            "translation": translation,
-            "raw": {"verses": [{"text": "stub"}]},
-        }
+    async def stub_fetch(
+        client: Any, reference: str, translation: str, context_n: int, include_raw: bool = False  # noqa: ANN401
+    ) -> Any:  # noqa: ANN401
+        return srv.PassageOut(
+            reference=reference,
+            text=f"Stub text for {reference} in {translation} (±{context_n})",
+            translation=translation,
+            raw={"verses": [{"text": "stub"}]},
+        )
 
     # Patch the passage fetcher to avoid network
     import BIBLEFIGHT.server as srv  # type: ignore
@@ -77,13 +92,15 @@ async def test_analyze_claim_happy_path(monkeypatch: pytest.MonkeyPatch) -> None
     async def stub_challengers(claim: str, ctx: Any) -> list[str]:  # noqa: ANN401
         return ["Matthew 5:9-12"]
 
-    async def stub_fetch(client: Any, reference: str, translation: str, context_n: int) -> dict[str, Any] | None:  # noqa: ANN401
-        return {
-            "reference": reference,
-            "text": f"Text for {reference}",
-            "translation": translation,
-            "raw": {"verses": [{"text": "stub"}]},
-        }
+    async def stub_fetch(
+        client: Any, reference: str, translation: str, context_n: int, include_raw: bool = False  # noqa: ANN401
+    ) -> Any:  # noqa: ANN401
+        return srv.PassageOut(
+            reference=reference,
+            text=f"Text for {reference}",
+            translation=translation,
+            raw={"verses": [{"text": "stub"}]},
+        )
 
     import BIBLEFIGHT.server as srv  # type: ignore
 
@@ -161,13 +178,15 @@ async def test_analyze_claim_fallback_when_no_sampling_or_api(monkeypatch: pytes
         return []
 
     # Stub passage fetcher to avoid network and return predictable content
-    async def stub_fetch(client: Any, reference: str, translation: str, context_n: int) -> dict[str, Any] | None:  # noqa: ANN401
-        return {
-            "reference": reference,
-            "text": f"Text for {reference}",
-            "translation": translation,
-            "raw": {"verses": [{"text": "stub"}]},
-        }
+    async def stub_fetch(
+        client: Any, reference: str, translation: str, context_n: int, include_raw: bool = False  # noqa: ANN401
+    ) -> Any:  # noqa: ANN401
+        return srv.PassageOut(
+            reference=reference,
+            text=f"Text for {reference}",
+            translation=translation,
+            raw={"verses": [{"text": "stub"}]},
+        )
 
     monkeypatch.setattr(srv, "extract_references_via_llm", stub_extract)
     monkeypatch.setattr(srv, "propose_challengers", stub_challengers)
@@ -198,3 +217,522 @@ async def test_analyze_claim_fallback_when_no_sampling_or_api(monkeypatch: pytes
             assert "text" in p
             assert "snippet" in p
             assert p.get("snippet_chars") == 50
+
+
+def test_fallback_refs_by_keyword() -> None:
+    import BIBLEFIGHT.server as srv  # type: ignore
+
+    assert srv._fallback_candidate_refs("Riches are fleeting", 5)[0] == "1 Timothy 6:10"
+    assert srv._fallback_candidate_refs("Money's the root of all evil", 5)[0] == "1 Timothy 6:10"
+    assert srv._fallback_challenger_refs("A rich man’s reward", 5)[0] == "Matthew 5:9-12"
+    assert srv._fallback_challenger_refs("God helps those who helps themselves", 5)[0] == "Ephesians 2:8-9"
+    assert srv._fallback_candidate_refs("Blessed are the peacemakers", 2) == ["John 3:16", "Psalm 23:1-3"]
+
+
+def test_ttl_cache_evicts_and_expires(monkeypatch: pytest.MonkeyPatch) -> None:
+    import BIBLEFIGHT.cache as cache_mod  # type: ignore
+
+    now = [1000.0]
+    monkeypatch.setattr(cache_mod.time, "monotonic", lambda: now[0])
+    cache = cache_mod.TTLCache(maxsize=2, ttl=10)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    assert cache.get("a") == 1  # refreshes "a"; "b" is now least recent
+    cache.set("c", 3)
+    assert cache.get("b") is None
+    assert cache.get("a") == 1 and cache.get("c") == 3
+    now[0] += 11
+    assert cache.get("a") is None
+    assert len(cache) == 1
+
+
+@pytest.mark.asyncio
+async def test_fetch_passage_uses_cache() -> None:
+    import httpx
+    import BIBLEFIGHT.server as srv  # type: ignore
+
+    calls: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(str(request.url))
+        return httpx.Response(
+            200,
+            json={"reference": "John 3:16", "verses": [{"text": " For God so loved \n"}]},
+        )
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        first = await srv.fetch_passage_with_context(client, "John 3:16", "kjv", 7)
+        second = await srv.fetch_passage_with_context(client, "john 3:16", "kjv", 7)
+        with_raw = await srv.fetch_passage_with_context(client, "John 3:16", "kjv", 7, include_raw=True)
+    assert first is not None and first.text == "For God so loved"
+    assert first.raw is None
+    assert second is first
+    assert with_raw is not None and with_raw.raw and with_raw.raw["reference"] == "John 3:16"
+    assert len(calls) == 2
+
+
+def test_normalize_api_bible_id() -> None:
+    import BIBLEFIGHT.server as srv  # type: ignore
+
+    assert srv._normalize_api_bible_id("JHN.3.16") == "John 3:16"
+    assert srv._normalize_api_bible_id("JHN.3.16-JHN.3.18") == "John 3:16-18"
+    assert srv._normalize_api_bible_id("JHN.3.36-JHN.4.2") == "John 3:36-John 4:2"
+    assert srv._normalize_api_bible_id("XXX.1.1") is None
+    assert srv._normalize_api_bible_id("JHN.a.1") is None
+
+
+def test_make_snippet() -> None:
+    import BIBLEFIGHT.server as srv  # type: ignore
+
+    assert srv.make_snippet("", 10) == ""
+    assert srv.make_snippet("Jesus wept.", 20) == "Jesus wept."
+    assert srv.make_snippet(" Jesus\n  wept. ", 20) == "Jesus wept."
+    assert srv.make_snippet("Jesus\rwept.", 20) == "Jesus wept."
+    assert srv.make_snippet("Jesus\xa0wept.", 20) == "Jesus wept."
+    assert srv.make_snippet("In the beginning God created", 10) == "In the be…"
+
+
+def test_make_snippet_matches_split_join_for_all_whitespace() -> None:
+    import BIBLEFIGHT.server as srv  # type: ignore
+
+    spaces = [c for c in map(chr, range(sys.maxunicode + 1)) if c.isspace()]
+    for ws in spaces:
+        for text in (f"a{ws}b", f"{ws}a b", f"a b{ws}", f"a {ws}b"):
+            assert srv.make_snippet(text, 50) == " ".join(text.split()), repr(text)
+
+
+@pytest.mark.asyncio
+async def test_analyze_claim_uses_single_dual_sampling_call(monkeypatch: pytest.MonkeyPatch) -> None:
+    import BIBLEFIGHT.server as srv  # type: ignore
+
+    monkeypatch.setattr(srv.settings, "BIBLE_API_KEY", None, raising=False)
+    calls: list[str] = []
+
+    async def stub_dual(claim: str, ctx: Any) -> tuple[list[str], list[str]]:  # noqa: ANN401
+        calls.append("dual")
+        return ["John 3:16"], ["Romans 3:23"]
+
+    async def stub_single(claim: str, ctx: Any) -> list[str]:  # noqa: ANN401
+        calls.append("single")
+        return []
+
+    async def stub_fetch(
+        client: Any, reference: str, translation: str, context_n: int, include_raw: bool = False  # noqa: ANN401
+    ) -> Any:  # noqa: ANN401
+        return srv.PassageOut(reference=reference, text="t", translation=translation, raw={})
+
+    monkeypatch.setattr(srv, "_extract_refs_dual", stub_dual)
+    monkeypatch.setattr(srv, "extract_references_via_llm", stub_single)
+    monkeypatch.setattr(srv, "propose_challengers", stub_single)
+    monkeypatch.setattr(srv, "fetch_passage_with_context", stub_fetch)
+
+    async with Client(FastMCPTransport(srv.mcp)) as client:
+        resp = await client.call_tool("analyze_claim", {"args": {"claim": "For God so loved the world"}})
+        payload = _parse_payload(resp)
+    assert isinstance(payload, dict)
+    assert [p["reference"] for p in payload["candidates"]] == ["John 3:16"]
+    assert [p["reference"] for p in payload["challengers"]] == ["Romans 3:23"]
+    assert calls == ["dual"]
+
+
+@pytest.mark.asyncio
+async def test_fetch_many_drops_failures(monkeypatch: pytest.MonkeyPatch) -> None:
+    import BIBLEFIGHT.server as srv  # type: ignore
+
+    async def stub_fetch(
+        client: Any, reference: str, translation: str, context_n: int, include_raw: bool = False  # noqa: ANN401
+    ) -> Any:  # noqa: ANN401
+        if reference == "boom":
+            raise RuntimeError("network down")
+        if reference == "cancel":
+            raise asyncio.CancelledError()
+        if reference == "missing":
+            return None
+        return srv.PassageOut(reference=reference, text="Jesus  wept.", translation=translation)
+
+    monkeypatch.setattr(srv, "fetch_passage_with_context", stub_fetch)
+    passages = await srv._fetch_many(
+        client=None,  # type: ignore[arg-type]
+        refs=["John 11:35", "boom", "cancel", "missing"],
+        translation="kjv",
+        context_n=0,
+        snippet_limit=50,
+        include_snippets=True,
+        ctx=None,  # type: ignore[arg-type]
+        silent_errors=True,
+    )
+    assert [p.reference for p in passages] == ["John 11:35"]
+    assert passages[0].snippet == "Jesus wept." and passages[0].snippet_chars == 50
+
+
+@pytest.mark.asyncio
+async def test_analyze_claim_cancels_sibling_pipeline_on_error(monkeypatch: pytest.MonkeyPatch) -> None:
+    import BIBLEFIGHT.server as srv  # type: ignore
+
+    monkeypatch.setattr(srv.settings, "BIBLE_API_KEY", None, raising=False)
+    cancelled = asyncio.Event()
+
+    async def failing_extract(claim: str, ctx: Any) -> list[str]:  # noqa: ANN401
+        raise RuntimeError("boom")
+
+    async def slow_challengers(claim: str, ctx: Any) -> list[str]:  # noqa: ANN401
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+        return []
+
+    async def no_dual(claim: str, ctx: Any) -> tuple[list[str], list[str]]:  # noqa: ANN401
+        return [], []
+
+    monkeypatch.setattr(srv, "_extract_refs_dual", no_dual)
+    monkeypatch.setattr(srv, "extract_references_via_llm", failing_extract)
+    monkeypatch.setattr(srv, "propose_challengers", slow_challengers)
+
+    async with Client(FastMCPTransport(srv.mcp)) as client:
+        with pytest.raises(Exception):
+            await client.call_tool("analyze_claim", {"args": {"claim": "Blessed are the meek"}})
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_llm_refs_cached_by_canonical_claim() -> None:
+    import BIBLEFIGHT.server as srv  # type: ignore
+
+    prompts: list[str] = []
+
+    class StubCtx:
+        async def sample(self, prompt: str, system_prompt: str | None = None) -> Any:  # noqa: ANN401
+            prompts.append(prompt)
+            return type("Resp", (), {"text": "1 Timothy 6:10;\nMatthew 6:24"})()
+
+    ctx = StubCtx()
+    first = await srv.extract_references_via_llm("Money is the root of all evil", ctx)  # type: ignore[arg-type]
+    second = await srv.extract_references_via_llm("money is root of all evil!", ctx)  # type: ignore[arg-type]
+    assert first == second == ["1 Timothy 6:10", "Matthew 6:24"]
+    assert len(prompts) == 1
+
+
+@pytest.mark.asyncio
+async def test_dual_extraction_tolerates_non_list_fields() -> None:
+    import BIBLEFIGHT.server as srv  # type: ignore
+
+    replies = iter([
+        '{"support": "John 3:16; Romans 8:28", "challenge": "Micah 6:8"}',
+        '{"support": [{"ref": "John 3:16"}, 3, " Psalm 23:1 "], "challenge": {"ref": "Micah 6:8"}}',
+    ])
+
+    class StubCtx:
+        async def sample(self, prompt: str, system_prompt: str | None = None) -> Any:  # noqa: ANN401
+            return type("Resp", (), {"text": next(replies)})()
+
+    ctx = StubCtx()
+    assert await srv._extract_refs_dual("Love one another", ctx) == (  # type: ignore[arg-type]
+        ["John 3:16", "Romans 8:28"],
+        ["Micah 6:8"],
+    )
+    assert await srv._extract_refs_dual("Love your enemies", ctx) == (["Psalm 23:1"], [])  # type: ignore[arg-type]
+    assert srv._llm_ref_cache.get(("challenge", srv._canonical_claim("Love your enemies"))) is None
+
+
+def test_canonical_claim_keeps_non_ascii_words() -> None:
+    import BIBLEFIGHT.server as srv  # type: ignore
+
+    assert srv._canonical_claim("神爱世人") != srv._canonical_claim("爱是恒久忍耐")
+    assert srv._canonical_claim("Él es amor") == "él es amor"
+    assert srv._canonical_claim("  ¡¿?!  ") == "¡¿?!"
+
+
+@pytest.mark.asyncio
+async def test_get_reference_uses_shared_client(monkeypatch: pytest.MonkeyPatch) -> None:
+    import httpx
+    import BIBLEFIGHT.server as srv  # type: ignore
+
+    seen: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        seen.append(request.url.raw_path.decode())
+        assert request.url.params["translation"] == "kjv"
+        return httpx.Response(200, json={"reference": "Psalm 23:1", "verses": [{"text": "The LORD is my shepherd"}]})
+
+    monkeypatch.setattr(srv, "_http_client", httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+
+    async with Client(FastMCPTransport(srv.mcp)) as client:
+        for _ in range(2):
+            resp = await client.call_tool("get_reference", {"args": {"reference": "Psalm 23:1"}})
+            payload = _parse_payload(resp)
+            assert isinstance(payload, dict) and payload["text"] == "The LORD is my shepherd"
+    assert seen == ["/Psalm%2023:1?translation=kjv"]
+
+
+@pytest.mark.asyncio
+async def test_fetch_passage_retries_without_ordinal_space() -> None:
+    import httpx
+    import BIBLEFIGHT.server as srv  # type: ignore
+
+    paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        paths.append(request.url.path)
+        if request.url.path.startswith("/1Timothy"):
+            return httpx.Response(200, json={"reference": "1 Timothy 6:10", "verses": [{"text": "For the love of money"}]})
+        return httpx.Response(404, json={"error": "not found"})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        passage = await srv.fetch_passage_with_context(client, "1 Timothy 6:10", "kjv", 0)
+        missing = await srv.fetch_passage_with_context(client, "Hezekiah 1:1", "kjv", 0)
+    assert passage is not None and passage.reference == "1 Timothy 6:10"
+    assert missing is None
+    assert len(paths) == 3
+
+
+def test_dedupe_refs_keeps_first_spelling() -> None:
+    import BIBLEFIGHT.server as srv  # type: ignore
+
+    refs = ["John 3:16", " john 3:16 ", "", "Psalm 23", "JOHN 3:16", "Micah 6:8"]
+    assert srv._dedupe_refs(refs, 5) == ["John 3:16", "Psalm 23", "Micah 6:8"]
+    assert srv._dedupe_refs(refs, 2) == ["John 3:16", "Psalm 23"]
+
+
+def test_json_loads_without_orjson(monkeypatch: pytest.MonkeyPatch) -> None:
+    import BIBLEFIGHT.server as srv  # type: ignore
+
+    body = b'{"reference": "John 3:16", "verses": [{"verse": 16}]}'
+    fast = srv._json_loads(body)
+    monkeypatch.setattr(srv, "orjson", None)
+    assert srv._json_loads(body) == fast == {"reference": "John 3:16", "verses": [{"verse": 16}]}
+
+
+@pytest.mark.asyncio
+async def test_bible_api_concurrency_is_bounded(monkeypatch: pytest.MonkeyPatch) -> None:
+    import httpx
+    import BIBLEFIGHT.server as srv  # type: ignore
+
+    monkeypatch.setattr(srv.settings, "BIBLE_API_MAX_CONCURRENCY", 2)
+    monkeypatch.setattr(srv, "_bible_api_sem", None)
+    in_flight = peak = 0
+
+    async def handler(request: httpx.Request) -> httpx.Response:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        return httpx.Response(200, json={"reference": request.url.path, "verses": [{"text": "x"}]})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        refs = [f"Psalm {n}" for n in range(1, 7)]
+        results = await asyncio.gather(*[srv.fetch_passage_with_context(client, r, "kjv", 0) for r in refs])
+    assert all(results)
+    assert peak == 2
+
+
+def test_make_cache_on_disk(tmp_path: Path) -> None:
+    pytest.importorskip("diskcache")
+    import BIBLEFIGHT.cache as cache_mod  # type: ignore
+    import BIBLEFIGHT.server as srv  # type: ignore
+
+    cache = cache_mod.make_cache("passage", maxsize=8, ttl=60, directory=str(tmp_path))
+    other = cache_mod.make_cache("search", maxsize=8, ttl=60, directory=str(tmp_path))
+    passage = srv.PassageOut.model_construct(reference="John 3:16", text="For God", translation="kjv", raw=None)
+    cache.set("john 3:16|kjv|7|0", passage)
+    restored = cache.get("john 3:16|kjv|7|0")
+    assert restored == passage
+    assert other.get("john 3:16|kjv|7|0") is None
+    cache.clear()
+    assert cache.get("john 3:16|kjv|7|0") is None
+    assert isinstance(cache_mod.make_cache("x", maxsize=8, ttl=60), cache_mod.TTLCache)
+
+
+def test_disk_cache_enforces_maxsize(tmp_path: Path) -> None:
+    pytest.importorskip("diskcache")
+    import BIBLEFIGHT.cache as cache_mod  # type: ignore
+
+    cache = cache_mod.make_cache("bounded", maxsize=2, ttl=60, directory=str(tmp_path))
+    for key in ("a", "b", "c"):
+        cache.set(key, key.upper())
+    assert len(cache) == 2
+    assert cache.get("a") is None
+    assert cache.get("b") == "B" and cache.get("c") == "C"
+    # Re-storing "b" makes it the newest, so "c" is evicted next
+    cache.set("b", "B2")
+    cache.set("d", "D")
+    assert cache.get("c") is None
+    assert cache.get("b") == "B2" and cache.get("d") == "D"
+
+
+def test_get_settings_is_cached_and_rereadable(monkeypatch: pytest.MonkeyPatch) -> None:
+    from BIBLEFIGHT.settings import get_settings  # type: ignore
+
+    assert get_settings() is get_settings()
+    monkeypatch.setenv("BIBLEFIGHT_DEFAULT_MAX_RESULTS", "2")
+    get_settings.cache_clear()
+    try:
+        assert get_settings().DEFAULT_MAX_RESULTS == 2
+    finally:
+        get_settings.cache_clear()
+
+
+@pytest.mark.asyncio
+async def test_fetch_many_batches_simple_refs(monkeypatch: pytest.MonkeyPatch) -> None:
+    import httpx
+    import BIBLEFIGHT.server as srv  # type: ignore
+
+    monkeypatch.setattr(srv.settings, "BATCH_FETCH", True)
+    paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        paths.append(path)
+        if "," in path:
+            return httpx.Response(200, json={"reference": "combined", "verses": [
+                {"book_name": "John", "chapter": 3, "verse": 16, "text": "For God so loved\n"},
+                {"book_name": "Psalms", "chapter": 23, "verse": 1, "text": "The LORD is my shepherd;\n"},
+                {"book_name": "Psalms", "chapter": 23, "verse": 2, "text": "He maketh me\n"},
+            ]})
+        return httpx.Response(200, json={"reference": "Song of Songs 2:1", "verses": [{"text": "I am the rose"}]})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        passages = await srv._fetch_many(
+            client=client,
+            refs=["John 3:16", "Psalm 23:1-2", "Song of Songs 2:1"],
+            translation="kjv",
+            context_n=0,
+            snippet_limit=None,
+            include_snippets=False,
+            ctx=None,  # type: ignore[arg-type]
+        )
+    # Batched passages carry the API's book naming, like the single-ref path
+    assert [p.reference for p in passages] == ["John 3:16", "Psalms 23:1-2", "Song of Songs 2:1"]
+    assert passages[1].text == "The LORD is my shepherd; He maketh me"
+    # One combined request; the ref whose book name doesn't match falls back to its own request
+    assert len(paths) == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_many_batch_leaves_overlapping_refs_out(monkeypatch: pytest.MonkeyPatch) -> None:
+    import httpx
+    import BIBLEFIGHT.server as srv  # type: ignore
+
+    monkeypatch.setattr(srv.settings, "BATCH_FETCH", True)
+    psalm = [{"book_name": "Psalms", "chapter": 23, "verse": n, "text": f"v{n}"} for n in range(1, 7)]
+    paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path
+        paths.append(path)
+        if "," in path:
+            # bible-api.com echoes each comma-separated segment's verses in order
+            segments = {
+                "Psalm 23:4": [psalm[3]],
+                "Psalm 23:1-6": psalm,
+                "John 3:16": [{"book_name": "John", "chapter": 3, "verse": 16, "text": "jn"}],
+            }
+            verses = [v for seg in path.lstrip("/").split(",") for v in segments[seg]]
+            return httpx.Response(200, json={"reference": "combined", "verses": verses})
+        if path.endswith("23:4"):
+            return httpx.Response(200, json={"reference": "Psalms 23:4", "verses": [psalm[3]]})
+        return httpx.Response(200, json={"reference": "Psalms 23:1-6", "verses": psalm})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        passages = await srv._fetch_many(
+            client=client,
+            refs=["Psalm 23:4", "Psalm 23:1-6", "John 3:16"],
+            translation="kjv",
+            context_n=0,
+            snippet_limit=None,
+            include_snippets=False,
+            ctx=None,  # type: ignore[arg-type]
+        )
+    assert [(p.reference, p.text) for p in passages] == [
+        ("Psalms 23:4", "v4"),
+        ("Psalms 23:1-6", "v1 v2 v3 v4 v5 v6"),
+        ("John 3:16", "jn"),
+    ]
+    # 23:1-6 overlaps 23:4, so it is fetched on its own rather than in the combined request
+    assert sum("," in p for p in paths) == 1 and len(paths) == 2
+
+
+@pytest.mark.asyncio
+async def test_fetch_many_batch_resolves_books_unambiguously(monkeypatch: pytest.MonkeyPatch) -> None:
+    import httpx
+    import BIBLEFIGHT.server as srv  # type: ignore
+
+    monkeypatch.setattr(srv.settings, "BATCH_FETCH", True)
+    segments = {
+        "Philemon 1:3": [{"book_name": "Philemon", "chapter": 1, "verse": 3, "text": "Grace to you"}],
+        "Phil 1:3": [{"book_name": "Philippians", "chapter": 1, "verse": 3, "text": "I thank my God"}],
+        "Philippians 1:4": [{"book_name": "Philippians", "chapter": 1, "verse": 4, "text": "Always in every prayer"}],
+    }
+    paths: list[str] = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        path = request.url.path.lstrip("/")
+        paths.append(path)
+        verses = [v for seg in path.split(",") for v in segments[seg]]
+        return httpx.Response(200, json={"reference": "r", "verses": verses})
+
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as client:
+        passages = await srv._fetch_many(
+            client=client,
+            refs=["Philemon 1:3", "Phil 1:3", "Philippians 1:4"],
+            translation="kjv",
+            context_n=0,
+            snippet_limit=None,
+            include_snippets=False,
+            ctx=None,  # type: ignore[arg-type]
+        )
+    assert [p.text for p in passages] == ["Grace to you", "I thank my God", "Always in every prayer"]
+    assert srv._canonical_book("Phil") is None and srv._canonical_book("Ps") == "psalms"
+    # "Phil" is ambiguous (Philippians/Philemon), so it is fetched on its own
+    assert sorted(paths) == ["Phil 1:3", "Philemon 1:3,Philippians 1:4"]
+
+
+@pytest.mark.asyncio
+async def test_analyze_claim_skips_candidate_search_when_not_supporting(monkeypatch: pytest.MonkeyPatch) -> None:
+    import BIBLEFIGHT.server as srv  # type: ignore
+
+    monkeypatch.setattr(srv.settings, "BIBLE_API_KEY", None, raising=False)
+
+    async def must_not_run(claim: str, ctx: Any) -> Any:  # noqa: ANN401
+        raise AssertionError("candidate extraction should be skipped")
+
+    async def stub_challengers(claim: str, ctx: Any) -> list[str]:  # noqa: ANN401
+        return ["Micah 6:8"]
+
+    async def stub_fetch(
+        client: Any, reference: str, translation: str, context_n: int, include_raw: bool = False  # noqa: ANN401
+    ) -> Any:  # noqa: ANN401
+        return srv.PassageOut(reference=reference, text="t", translation=translation)
+
+    monkeypatch.setattr(srv, "_extract_refs_dual", must_not_run)
+    monkeypatch.setattr(srv, "extract_references_via_llm", must_not_run)
+    monkeypatch.setattr(srv, "propose_challengers", stub_challengers)
+    monkeypatch.setattr(srv, "fetch_passage_with_context", stub_fetch)
+
+    async with Client(FastMCPTransport(srv.mcp)) as client:
+        args = {"claim": "Do justly", "include_supporting": False, "include_challengers": True}
+        payload = _parse_payload(await client.call_tool("analyze_claim", {"args": args}))
+    assert isinstance(payload, dict)
+    assert payload["candidates"] == []
+    assert [p["reference"] for p in payload["challengers"]] == ["Micah 6:8"]
+
+
+def test_split_refs_handles_semicolons_and_newlines() -> None:
+    import BIBLEFIGHT.server as srv  # type: ignore
+
+    text = " John 3:16;; Romans 8:28\n\nPsalm 23:1 ;\n"
+    assert srv._split_refs(text) == ["John 3:16", "Romans 8:28", "Psalm 23:1"]
+    assert srv._split_refs("") == []
+
+
+def test_arg_models_reject_unknown_fields() -> None:
+    import pydantic
+
+    import BIBLEFIGHT.server as srv  # type: ignore
+
+    with pytest.raises(pydantic.ValidationError):
+        srv.AnalyzeClaimArgs(claim="x", max_result=3)
+    with pytest.raises(pydantic.ValidationError):
+        srv.GetReferenceArgs(reference="John 3:16").reference = "John 1:1"